@@ -982,14 +982,21 @@ class GraphQLClient(AsyncBaseClient):
               addresses(filter: $filter) {
                 objects {
                   validities {
-                    address_type {
-                      user_key
-                    }
+                    value: name
+                    value2
                     uuid
+                    visibility_uuid
+                    employee_uuid
+                    org_unit_uuid
+                    engagement_uuid
                     validity {
                       from
                       to
                     }
+                    address_type {
+                      user_key
+                      uuid
+                    }
                   }
                 }
               }
@@ -1014,10 +1021,14 @@ class GraphQLClient(AsyncBaseClient):
                       user_key
                     }
                     uuid
+                    user_key
                     validity {
                       from
                       to
                     }
+                    employee_uuid
+                    itsystem_uuid
+                    engagement_uuid
                   }
                 }
               }
@@ -19,13 +19,15 @@ class ReadFilteredAddressesAddressesObjects(BaseModel):
 
 
 class ReadFilteredAddressesAddressesObjectsValidities(BaseModel):
-    address_type: "ReadFilteredAddressesAddressesObjectsValiditiesAddressType"
+    value: str | None
+    value2: str | None
     uuid: UUID
+    visibility_uuid: UUID | None
+    employee_uuid: UUID | None
+    org_unit_uuid: UUID | None
+    engagement_uuid: UUID | None
     validity: "ReadFilteredAddressesAddressesObjectsValiditiesValidity"
-
-
-class ReadFilteredAddressesAddressesObjectsValiditiesAddressType(BaseModel):
-    user_key: str
+    address_type: "ReadFilteredAddressesAddressesObjectsValiditiesAddressType"
 
 
 class ReadFilteredAddressesAddressesObjectsValiditiesValidity(BaseModel):
@@ -33,9 +35,14 @@ class ReadFilteredAddressesAddressesObjectsValiditiesValidity(BaseModel):
     to: datetime | None
 
 
+class ReadFilteredAddressesAddressesObjectsValiditiesAddressType(BaseModel):
+    user_key: str
+    uuid: UUID
+
+
 ReadFilteredAddresses.update_forward_refs()
 ReadFilteredAddressesAddresses.update_forward_refs()
 ReadFilteredAddressesAddressesObjects.update_forward_refs()
 ReadFilteredAddressesAddressesObjectsValidities.update_forward_refs()
-ReadFilteredAddressesAddressesObjectsValiditiesAddressType.update_forward_refs()
 ReadFilteredAddressesAddressesObjectsValiditiesValidity.update_forward_refs()
+ReadFilteredAddressesAddressesObjectsValiditiesAddressType.update_forward_refs()
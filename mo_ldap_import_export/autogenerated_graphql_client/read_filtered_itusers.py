@@ -21,7 +21,11 @@ class ReadFilteredItusersItusersObjects(BaseModel):
 class ReadFilteredItusersItusersObjectsValidities(BaseModel):
     itsystem: "ReadFilteredItusersItusersObjectsValiditiesItsystem"
     uuid: UUID
+    user_key: str
     validity: "ReadFilteredItusersItusersObjectsValiditiesValidity"
+    employee_uuid: UUID | None
+    itsystem_uuid: UUID
+    engagement_uuid: UUID | None
 
 
 class ReadFilteredItusersItusersObjectsValiditiesItsystem(BaseModel):
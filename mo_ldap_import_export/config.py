@@ -286,7 +286,9 @@ def yaml_config_settings_source(
         text = Path("/var/run/config.yaml").read_text(encoding)
     except FileNotFoundError:
         return {}
-    config: dict[str, Any] = yaml.load(text, yaml.SafeLoader)
+    # Prefer the libyaml-backed loader when available, it has the same semantics
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    config: dict[str, Any] = yaml.load(text, loader)
     return {k.lower(): v for k, v in config.items()}
 
 
@@ -343,13 +345,13 @@ class Settings(BaseSettings):
         True, description="Whether to write to MO, when changes in LDAP are registered"
     )
 
-    mo_uuids_to_ignore: list[UUID] = Field(
-        default_factory=list,
+    mo_uuids_to_ignore: set[UUID] = Field(
+        default_factory=set,
         description="Set of MO UUIDs to ignore changes to",
     )
 
-    ldap_uuids_to_ignore: list[UUID] = Field(
-        default_factory=list,
+    ldap_uuids_to_ignore: set[UUID] = Field(
+        default_factory=set,
         description="Set of LDAP UUIDs to ignore changes to",
     )
 
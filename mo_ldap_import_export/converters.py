@@ -19,7 +19,6 @@ from .ldap_classes import LdapObject
 from .models import MOBase
 from .models import Termination
 from .utils import delete_keys_from_dict
-from .utils import is_list
 from .utils import mo_today
 
 logger = structlog.stdlib.get_logger()
@@ -41,6 +40,9 @@ class LdapConverter:
             ["objectClass", "_import_to_mo_", "_ldap_attributes_"],
         )
 
+        # Identical template strings recur across the mapping, thus each distinct
+        # string is only compiled once per environment
+        self._templates: dict[tuple[Environment, str], Template] = {}
         self.mapping = self._populate_mapping_with_templates(mapping, self.environment)
 
     def get_ldap_attributes(self, json_key, remove_dn=True) -> list[str]:
@@ -66,7 +68,12 @@ class LdapConverter:
     def string2template(
         self, environment: Environment, template_string: str
     ) -> Template:
-        return environment.from_string(template_string)
+        key = (environment, template_string)
+        template = self._templates.get(key)
+        if template is None:
+            template = environment.from_string(template_string)
+            self._templates[key] = template
+        return template
 
     def _populate_mapping_with_templates(
         self, mapping: dict[str, Any], environment: Environment
@@ -122,6 +129,41 @@ class LdapConverter:
         # One value per field. Not multiple. LDAP objects however, can have multiple
         # values per field.
         number_of_entries = self.get_number_of_entries(ldap_object)
+        # Loop invariants are computed once, rather than once per entry
+        ldap_object_dict = ldap_object.dict()
+
+        try:
+            object_mapping = self.mapping["ldap_to_mo"][json_key]
+        except KeyError as error:
+            raise IncorrectMapping(
+                f"Missing '{json_key}' in mapping 'ldap_to_mo'"
+            ) from error
+
+        async def render_template(field_name: str, template, context) -> Any:
+            value = (await template.render_async(context)).strip()
+
+            # Sloppy mapping can lead to the following rendered strings:
+            # - {{ldap.mail or None}} renders as "None"
+            # - {{ldap.mail}} renders as "[]" if ldap.mail is empty
+            #
+            # Mapping with {{ldap.mail or ''}} solves both, but let's check
+            # for "none" or "[]" strings anyway to be more robust.
+            if value.lower() == "none" or value == "[]":
+                value = ""
+
+            # TODO: Is it possible to render a dictionary directly?
+            #       Instead of converting from a string
+            if "{" in value and ":" in value and "}" in value:
+                try:
+                    value = self.str_to_dict(value)
+                except JSONDecodeError as error:
+                    error_string = f"Could not convert {value} in {json_key}['{field_name}'] to dict (context={context!r})"
+                    raise IncorrectMapping(error_string) from error
+            return value
+
+        assert self.settings.conversion_mapping.ldap_to_mo is not None
+        mo_class = self.settings.conversion_mapping.ldap_to_mo[json_key].as_mo_class()
+        required_attributes = get_required_attributes(mo_class)
 
         converted_objects: list[MOBase | Termination] = []
         for entry in range(number_of_entries):
@@ -129,54 +171,22 @@ class LdapConverter:
                 {
                     key: (
                         value[min(entry, len(value) - 1)]
-                        if is_list(value) and len(value) > 0
+                        if isinstance(value, list) and value
                         else value
                     )
-                    for key, value in ldap_object.dict().items()
+                    for key, value in ldap_object_dict.items()
                 }
             )
             context = {
                 "ldap": ldap_dict,
                 "employee_uuid": str(employee_uuid),
             }
-            try:
-                object_mapping = self.mapping["ldap_to_mo"][json_key]
-            except KeyError as error:
-                raise IncorrectMapping(
-                    f"Missing '{json_key}' in mapping 'ldap_to_mo'"
-                ) from error
-
-            async def render_template(field_name: str, template, context) -> Any:
-                value = (await template.render_async(context)).strip()
-
-                # Sloppy mapping can lead to the following rendered strings:
-                # - {{ldap.mail or None}} renders as "None"
-                # - {{ldap.mail}} renders as "[]" if ldap.mail is empty
-                #
-                # Mapping with {{ldap.mail or ''}} solves both, but let's check
-                # for "none" or "[]" strings anyway to be more robust.
-                if value.lower() == "none" or value == "[]":
-                    value = ""
-
-                # TODO: Is it possible to render a dictionary directly?
-                #       Instead of converting from a string
-                if "{" in value and ":" in value and "}" in value:
-                    try:
-                        value = self.str_to_dict(value)
-                    except JSONDecodeError as error:
-                        error_string = f"Could not convert {value} in {json_key}['{field_name}'] to dict (context={context!r})"
-                        raise IncorrectMapping(error_string) from error
-                return value
 
             # TODO: asyncio.gather this for future dataloader bulking
             mo_dict = {
                 mo_field_name: await render_template(mo_field_name, template, context)
                 for mo_field_name, template in object_mapping.items()
             }
-            assert self.settings.conversion_mapping.ldap_to_mo is not None
-            mo_class = self.settings.conversion_mapping.ldap_to_mo[
-                json_key
-            ].as_mo_class()
 
             if mo_dict.get("_terminate_"):
                 # TODO: Convert this to pydantic check
@@ -195,8 +205,6 @@ class LdapConverter:
                 )
                 continue
 
-            required_attributes = get_required_attributes(mo_class)
-
             # Load our validity default, if it is not set
             if "validity" in required_attributes:
                 assert (
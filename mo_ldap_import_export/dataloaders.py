@@ -16,6 +16,7 @@ from .exceptions import DNNotFound
 from .exceptions import MultipleObjectsReturnedException
 from .exceptions import NoObjectsReturnedException
 from .ldap import apply_discriminator
+from .ldap import construct_discriminator_templates
 from .ldap import is_uuid
 from .ldapapi import LDAPAPI
 from .moapi import MOAPI
@@ -35,6 +36,8 @@ class DataLoader:
         self.ldapapi = ldapapi
         self.moapi = moapi
         self.username_generator = username_generator
+        # The discriminator is fixed by the settings, thus compiled once here
+        self.discriminator_templates = construct_discriminator_templates(settings)
 
     async def find_mo_employee_uuid_via_cpr_number(self, dn: str) -> set[EmployeeUUID]:
         cpr_number = await self.ldapapi.dn2cpr(dn)
@@ -191,13 +194,16 @@ class DataLoader:
         return set()
 
     async def make_mo_employee_dn(self, uuid: UUID) -> DN:
-        employee = await self.moapi.load_mo_employee(uuid)
+        # The employee and the IT-system lookups are independent
+        employee, raw_it_system_uuid = await asyncio.gather(
+            self.moapi.load_mo_employee(uuid),
+            self.moapi.get_ldap_it_system_uuid(),
+        )
         if employee is None:
             raise NoObjectsReturnedException(f"Unable to lookup employee: {uuid}")
         cpr_number = CPRNumber(employee.cpr_number) if employee.cpr_number else None
 
         # Check if we even dare create a DN
-        raw_it_system_uuid = await self.moapi.get_ldap_it_system_uuid()
         if raw_it_system_uuid is None and cpr_number is None:
             logger.warning(
                 "Could not or generate a DN for employee (cannot correlate)",
@@ -232,7 +238,10 @@ class DataLoader:
         if dns:
             logger.info("Found DNs for user", dns=dns, uuid=uuid)
             best_dn = await apply_discriminator(
-                self.settings, self.ldapapi.ldap_connection, dns
+                self.settings,
+                self.ldapapi.ldap_connection,
+                dns,
+                self.discriminator_templates,
             )
             # If no good LDAP account was found, we do not want to synchronize at all
             if best_dn:
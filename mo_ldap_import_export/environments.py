@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Magenta ApS <https://magenta.dk>
 # SPDX-License-Identifier: MPL-2.0
-import string
+import asyncio
+import re
 from contextlib import suppress
 from datetime import datetime
 from functools import partial
@@ -25,9 +26,12 @@ from pydantic import parse_obj_as
 
 from mo_ldap_import_export.ldap import get_ldap_object
 from mo_ldap_import_export.moapi import MOAPI
+from mo_ldap_import_export.moapi import address_from_validity
 from mo_ldap_import_export.moapi import extract_current_or_latest_validity
 from mo_ldap_import_export.moapi import flatten_validities
 from mo_ldap_import_export.moapi import get_primary_engagement
+from mo_ldap_import_export.moapi import ituser_from_validity
+from mo_ldap_import_export.moapi import read_class_uuid
 from mo_ldap_import_export.models import Address
 from mo_ldap_import_export.models import Engagement
 from mo_ldap_import_export.models import ITUser
@@ -55,6 +59,10 @@ from .utils import mo_today
 logger = structlog.stdlib.get_logger()
 T = TypeVar("T")
 
+# Only ASCII digits are kept, unlike \D which would also keep other Unicode digits
+NON_DIGITS_REGEX = re.compile(r"[^0-9]+")
+CURLY_BRACKETS_TABLE = str.maketrans("", "", "{}")
+
 
 def filter_mo_datestring(datetime_object):
     """
@@ -67,18 +75,19 @@ def filter_mo_datestring(datetime_object):
     # TODO: should take timezone-aware datetime_object and convert using MO_TZ.
     if not datetime_object:
         return None
-    return datetime_object.strftime("%Y-%m-%dT00:00:00")
+    d = datetime_object
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}T00:00:00"
 
 
 def filter_strip_non_digits(input_string):
     if not isinstance(input_string, str):
         return None
-    return "".join(c for c in input_string if c in string.digits)
+    return NON_DIGITS_REGEX.sub("", input_string)
 
 
 def filter_remove_curly_brackets(text: str) -> str:
     # TODO: Should this remove everything or just a single set?
-    return text.replace("{", "").replace("}", "")
+    return text.translate(CURLY_BRACKETS_TABLE)
 
 
 def bitwise_and(input: int, bitmask: int) -> int:
@@ -96,32 +105,31 @@ def bitwise_and(input: int, bitmask: int) -> int:
     return input & bitmask
 
 
-async def _get_facet_class_uuid(
-    graphql_client: GraphQLClient, class_user_key: str, facet_user_key: str
-) -> str:
-    result = await graphql_client.read_class_uuid_by_facet_and_class_user_key(
-        facet_user_key, class_user_key
-    )
-    exception = UUIDNotFoundException(
-        f"class not found, facet_user_key: {facet_user_key} class_user_key: {class_user_key}"
-    )
-    return str(one(result.objects, too_short=exception).uuid)
-
+async def get_org_unit_ancestor_names(
+    graphql_client: GraphQLClient, uuid: str | UUID
+) -> list[str]:
+    """Get the names of the org-unit and its ancestors, from the root and down.
 
-get_employee_address_type_uuid = partial(
-    _get_facet_class_uuid, facet_user_key="employee_address_type"
-)
-get_visibility_uuid = partial(_get_facet_class_uuid, facet_user_key="visibility")
+    Templates needing several layers can fetch this once and index it locally.
 
+    Args:
+        graphql_client: GraphQLClient to fetch org-units from MO with.
+        uuid: Organisation Unit UUID of the org-unit to find ancestors of.
 
-async def get_org_unit_path_string(
-    graphql_client: GraphQLClient, org_unit_path_string_separator: str, uuid: str | UUID
-) -> str:
+    Returns:
+        The ancestor names starting from the root, ending with the org-unit itself.
+    """
     uuid = uuid if isinstance(uuid, UUID) else UUID(uuid)
     result = await graphql_client.read_org_unit_ancestor_names(uuid)
     current = one(result.objects).current
     assert current is not None
-    names = [x.name for x in reversed(current.ancestors)] + [current.name]
+    return [x.name for x in reversed(current.ancestors)] + [current.name]
+
+
+async def get_org_unit_path_string(
+    graphql_client: GraphQLClient, org_unit_path_string_separator: str, uuid: str | UUID
+) -> str:
+    names = await get_org_unit_ancestor_names(graphql_client, uuid)
     assert org_unit_path_string_separator not in names
     return org_unit_path_string_separator.join(names)
 
@@ -164,11 +172,7 @@ async def get_org_unit_name_for_parent(
         The name of the ancestor at the n'th layer above the provided org-unit.
         If the layer provided is beyond the depth available None is returned.
     """
-    uuid = uuid if isinstance(uuid, UUID) else UUID(uuid)
-    result = await graphql_client.read_org_unit_ancestor_names(uuid)
-    current = one(result.objects).current
-    assert current is not None
-    names = [x.name for x in reversed(current.ancestors)] + [current.name]
+    names = await get_org_unit_ancestor_names(graphql_client, uuid)
     with suppress(IndexError):
         return names[layer]
     return None
@@ -226,7 +230,7 @@ async def _get_or_create_facet_class(
         logger.info("class_user_key is empty, using provided default", default=default)
         class_user_key = default
     try:
-        return await _get_facet_class_uuid(
+        return await read_class_uuid(
             moapi.graphql_client,
             class_user_key=class_user_key,
             facet_user_key=facet_user_key,
@@ -298,12 +302,8 @@ async def load_it_user(
             itsystem_user_key=itsystem_user_key,
         )
         raise RequeueMessage("No active validities on it-user")
-    fetched_ituser = await moapi.load_mo_it_user(
-        validity.uuid, current_objects_only=False
-    )
-    if fetched_ituser is None:  # pragma: no cover
-        logger.error("Unable to load it-user", uuid=validity.uuid)
-        raise RequeueMessage("Unable to load it-user")
+    # The filtered query returns all it-user fields, so no refetch is needed
+    fetched_ituser = ituser_from_validity(validity.uuid, validity)
     delete = get_delete_flag(jsonable_encoder(fetched_ituser))
     if delete:
         logger.debug("IT-user is terminated", uuid=validity.uuid)
@@ -355,12 +355,8 @@ async def load_address(
             address_type_user_key=address_type_user_key,
         )
         raise RequeueMessage("No active validities on employee address")
-    fetched_address = await moapi.load_mo_address(
-        validity.uuid, current_objects_only=False
-    )
-    if fetched_address is None:  # pragma: no cover
-        logger.error("Unable to load employee address", uuid=validity.uuid)
-        raise RequeueMessage("Unable to load employee address")
+    # The filtered query returns all address fields, so no refetch is needed
+    fetched_address = address_from_validity(validity)
     delete = get_delete_flag(jsonable_encoder(fetched_address))
     if delete:
         logger.debug("Employee address is terminated", uuid=validity.uuid)
@@ -400,12 +396,8 @@ async def load_org_unit_address(
             address_type_user_key=address_type_user_key,
         )
         return None
-    fetched_address = await moapi.load_mo_address(
-        validity.uuid, current_objects_only=False
-    )
-    if fetched_address is None:  # pragma: no cover
-        logger.error("Unable to load org-unit address", uuid=validity.uuid)
-        raise RequeueMessage("Unable to load org-unit address")
+    # The filtered query returns all address fields, so no refetch is needed
+    fetched_address = address_from_validity(validity)
     delete = get_delete_flag(jsonable_encoder(fetched_address))
     if delete:
         logger.debug("Org-unit address is terminated", uuid=validity.uuid)
@@ -428,18 +420,22 @@ async def generate_common_name(
     employee_uuid: UUID,
     dn: DN,
 ) -> str:
-    # Fetch the current common name (if any)
-    ldap_connection = dataloader.ldapapi.ldap_connection
-    current_common_name = None
-    with suppress(NoObjectsReturnedException):
-        ldap_object = await get_ldap_object(ldap_connection, dn, ["cn"])
-        ldap_common_name = getattr(ldap_object, "cn", None)
-        if ldap_common_name is not None:
-            # This is a list on OpenLDAP, but not on AD
-            # We use ensure_list to ensure that AD is handled like Standard LDAP
-            current_common_name = one(ensure_list(ldap_common_name))
+    async def fetch_current_common_name() -> str | None:
+        ldap_connection = dataloader.ldapapi.ldap_connection
+        with suppress(NoObjectsReturnedException):
+            ldap_object = await get_ldap_object(ldap_connection, dn, ["cn"])
+            ldap_common_name = getattr(ldap_object, "cn", None)
+            if ldap_common_name is not None:
+                # This is a list on OpenLDAP, but not on AD
+                # We use ensure_list to ensure that AD is handled like Standard LDAP
+                return cast(str, one(ensure_list(ldap_common_name)))
+        return None
 
-    employee = await dataloader.moapi.load_mo_employee(employee_uuid)
+    # Fetch the current common name (if any) and the employee concurrently
+    current_common_name, employee = await asyncio.gather(
+        fetch_current_common_name(),
+        dataloader.moapi.load_mo_employee(employee_uuid),
+    )
     if employee is None:  # pragma: no cover
         raise NoObjectsReturnedException(f"Unable to lookup employee: {employee_uuid}")
     return cast(
@@ -511,10 +507,12 @@ def construct_globals_dict(
     return {
         "now": datetime.utcnow,  # TODO: timezone-aware datetime
         "get_employee_address_type_uuid": partial(
-            get_employee_address_type_uuid, graphql_client
+            moapi.get_class_uuid, facet_user_key="employee_address_type"
         ),
         "get_it_system_uuid": partial(moapi.get_it_system_uuid),
-        "get_visibility_uuid": partial(get_visibility_uuid, graphql_client),
+        "get_visibility_uuid": partial(
+            moapi.get_class_uuid, facet_user_key="visibility"
+        ),
         "get_org_unit_path_string": partial(
             get_org_unit_path_string,
             graphql_client,
@@ -523,6 +521,9 @@ def construct_globals_dict(
         "get_org_unit_name_for_parent": partial(
             get_org_unit_name_for_parent, graphql_client
         ),
+        "get_org_unit_ancestor_names": partial(
+            get_org_unit_ancestor_names, graphql_client
+        ),
         "get_job_function_name": partial(get_job_function_name, graphql_client),
         "get_org_unit_name": partial(get_org_unit_name, graphql_client),
         "get_or_create_job_function_uuid": partial(
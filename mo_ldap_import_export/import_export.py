@@ -16,6 +16,7 @@ from uuid import uuid4
 
 import structlog
 from fastramqpi.ramqp.depends import handle_exclusively_decorator
+from jinja2 import Template
 from ldap3 import Connection
 from more_itertools import one
 from more_itertools import partition
@@ -25,10 +26,10 @@ from .config import Settings
 from .converters import LdapConverter
 from .customer_specific_checks import ExportChecks
 from .customer_specific_checks import ImportChecks
-from .dataloaders import DN
 from .dataloaders import DataLoader
 from .exceptions import SkipObject
 from .ldap import apply_discriminator
+from .ldap import construct_discriminator_templates
 from .ldap import get_ldap_object
 from .moapi import Verb
 from .moapi import get_primary_engagement
@@ -39,6 +40,7 @@ from .models import ITUser
 from .models import JobTitleFromADToMO
 from .models import MOBase
 from .models import Termination
+from .types import DN
 from .types import EmployeeUUID
 from .types import OrgUnitUUID
 from .utils import ensure_list
@@ -87,6 +89,16 @@ class SyncTool:
         self.import_checks: ImportChecks = import_checks
         self.settings: Settings = settings
         self.ldap_connection: Connection = ldap_connection
+        # The mo2ldap template is fixed by the settings, thus it is compiled once
+        # here instead of on every export
+        mo2ldap = self.settings.conversion_mapping.mo2ldap
+        self.mo2ldap_template: Template | None = (
+            self.converter.environment.from_string(mo2ldap)
+            if mo2ldap is not None
+            else None
+        )
+        # The discriminator is fixed by the settings, thus compiled once here
+        self.discriminator_templates = construct_discriminator_templates(settings)
 
     @staticmethod
     def wait_for_import_to_finish(func: Callable):
@@ -123,10 +135,8 @@ class SyncTool:
     async def render_ldap2mo(self, uuid: EmployeeUUID, dn: DN) -> dict[str, list[Any]]:
         await self.perform_export_checks(uuid)
 
-        mo2ldap_template = self.settings.conversion_mapping.mo2ldap
-        assert mo2ldap_template is not None
-        template = self.converter.environment.from_string(mo2ldap_template)
-        result = await template.render_async({"uuid": uuid, "dn": dn})
+        assert self.mo2ldap_template is not None
+        result = await self.mo2ldap_template.render_async({"uuid": uuid, "dn": dn})
         parsed = json.loads(result)
         assert isinstance(parsed, dict)
         assert all(isinstance(key, str) for key in parsed)
@@ -231,8 +241,7 @@ class SyncTool:
             logger.warning("MO event ignored due to ignore-list")
             return {}
 
-        mo2ldap_template = self.settings.conversion_mapping.mo2ldap
-        if not mo2ldap_template:
+        if self.mo2ldap_template is None:
             logger.info("listen_to_changes_in_employees called without mapping")
             return {}
 
@@ -297,13 +306,15 @@ class SyncTool:
     ) -> list[tuple[MOBase, MOBase | None]]:
         mo_class = one({type(o) for o in converted_objects})
 
-        return [
-            (
-                converted_object,
-                await self.fetch_uuid_object(converted_object.uuid, mo_class),
+        # The lookups are independent, so they are issued concurrently rather than
+        # awaiting one roundtrip to MO per converted object
+        mo_objects = await asyncio.gather(
+            *(
+                self.fetch_uuid_object(converted_object.uuid, mo_class)
+                for converted_object in converted_objects
             )
-            for converted_object in converted_objects
-        ]
+        )
+        return list(zip(converted_objects, mo_objects, strict=True))
 
     async def format_converted_objects(
         self,
@@ -356,7 +367,14 @@ class SyncTool:
         ]
 
         # Convert updates to operations
-        mo_attributes = set(self.converter.get_mo_attributes(json_key))
+        # NOTE: UUID cannot be updated as it is used to decide what we update
+        # NOTE: objectClass is removed as it is an LDAP implemenation detail
+        # TODO: Why do we not update validity???
+        mo_attributes = set(self.converter.get_mo_attributes(json_key)) - {
+            "validity",
+            "uuid",
+            "objectClass",
+        }
         for converted_object, matching_object in updates:
             # Convert our objects to dicts
             mo_object_dict_to_upload = matching_object.dict()
@@ -366,15 +384,10 @@ class SyncTool:
             converted_mo_object_dict = converted_object.dict(by_alias=True)
 
             # Update the existing MO object with the converted values
-            # NOTE: UUID cannot be updated as it is used to decide what we update
-            # NOTE: objectClass is removed as it is an LDAP implemenation detail
-            # TODO: Why do we not update validity???
-            mo_attributes = mo_attributes - {"validity", "uuid", "objectClass"}
             # Only copy over keys that exist in both sets
-            mo_attributes = mo_attributes & converted_mo_object_dict.keys()
-
             update_values = {
-                key: converted_mo_object_dict[key] for key in mo_attributes
+                key: converted_mo_object_dict[key]
+                for key in mo_attributes & converted_mo_object_dict.keys()
             }
             logger.info(
                 "Setting values on upload dict",
@@ -465,7 +478,9 @@ class SyncTool:
         # We always want to synchronize from the best LDAP account, instead of just
         # synchronizing from the last LDAP account that has been touched.
         # Thus we process the list of DNs found for the user to pick the best one.
-        best_dn = await apply_discriminator(self.settings, self.ldap_connection, dns)
+        best_dn = await apply_discriminator(
+            self.settings, self.ldap_connection, dns, self.discriminator_templates
+        )
         # If no good LDAP account was found, we do not want to synchronize at all
         if best_dn is None:
             logger.info(
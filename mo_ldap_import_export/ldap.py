@@ -5,6 +5,7 @@
 import asyncio
 import signal
 from collections import ChainMap
+from collections.abc import AsyncIterator
 from contextlib import suppress
 from ssl import CERT_NONE
 from ssl import CERT_REQUIRED
@@ -264,8 +265,47 @@ async def ldap_search(
     return response, result
 
 
+def construct_discriminator_templates(settings: Settings) -> list[Template]:
+    """Compile the configured discriminator values into prioritized templates.
+
+    Args:
+        settings: The settings to read the discriminator configuration from.
+
+    Returns:
+        The compiled templates, the first being the most important.
+    """
+    discriminator_values = settings.discriminator_values
+    # If the discriminator_function is exclude, discriminator_values will be a
+    # list of disallowed values, and we will want to find an account that does not
+    # have any of these disallowed values whatsoever.
+    # NOTE: We assume that at most one such account exists.
+    if settings.discriminator_function == "exclude":
+        discriminator_values = [
+            "{{ value is none or value|string not in "
+            + str(discriminator_values)
+            + " }}"
+        ]
+
+    if settings.discriminator_function == "include":
+        # If the discriminator_function is include, discriminator_values will be a
+        # prioritized list of values (first meaning most important), and we will want
+        # to find the best (most important) account.
+        # NOTE: We assume that no two accounts are equally important.
+        # This is implemented using our template system below, so we simply wrap our
+        # values into simple jinja-templates.
+        discriminator_values = [
+            '{{ value == "' + str(dn_value) + '" }}'
+            for dn_value in discriminator_values
+        ]
+
+    return [Template(discriminator) for discriminator in discriminator_values]
+
+
 async def apply_discriminator(
-    settings: Settings, ldap_connection: Connection, dns: set[DN]
+    settings: Settings,
+    ldap_connection: Connection,
+    dns: set[DN],
+    discriminator_templates: list[Template] | None = None,
 ) -> DN | None:
     """Find the account to synchronize from a set of DNs.
 
@@ -273,6 +313,9 @@ async def apply_discriminator(
 
     Args:
         dns: The set of DNs to evaluate.
+        discriminator_templates:
+            The templates from `construct_discriminator_templates`, if the caller
+            has compiled them already.
 
     Raises:
         RequeueMessage: If the provided DNs could not be read from LDAP.
@@ -357,30 +400,6 @@ async def apply_discriminator(
     }
     assert dns == set(mapping.keys())
 
-    discriminator_values = settings.discriminator_values
-    # If the discriminator_function is exclude, discriminator_values will be a
-    # list of disallowed values, and we will want to find an account that does not
-    # have any of these disallowed values whatsoever.
-    # NOTE: We assume that at most one such account exists.
-    if settings.discriminator_function == "exclude":
-        discriminator_values = [
-            "{{ value is none or value|string not in "
-            + str(discriminator_values)
-            + " }}"
-        ]
-
-    if settings.discriminator_function == "include":
-        # If the discriminator_function is include, discriminator_values will be a
-        # prioritized list of values (first meaning most important), and we will want
-        # to find the best (most important) account.
-        # NOTE: We assume that no two accounts are equally important.
-        # This is implemented using our template system below, so we simply wrap our
-        # values into simple jinja-templates.
-        discriminator_values = [
-            '{{ value == "' + str(dn_value) + '" }}'
-            for dn_value in discriminator_values
-        ]
-
     def mapping2value(field_mapping: dict[str, str | None]) -> str | None:
         if len(field_mapping) != 1:
             return None
@@ -392,8 +411,9 @@ async def apply_discriminator(
     # want to find the best (most important) account.
     # We do this by evaluating the jinja template and looking for outcomes with "True".
     # NOTE: We assume no two accounts are equally important.
-    for discriminator in discriminator_values:
-        template = Template(discriminator)
+    if discriminator_templates is None:
+        discriminator_templates = construct_discriminator_templates(settings)
+    for template in discriminator_templates:
         dns_passing_template = {
             dn
             for dn in dns
@@ -421,12 +441,12 @@ def ldapresponse2entries(ldap_response: list[dict[str, Any]]) -> list[dict[str,
     return [entry for entry in ldap_response if entry["type"] == "searchResEntry"]
 
 
-async def _paged_search(
+async def _paged_search_iter(
     ldap_connection: Connection,
     searchParameters: dict,
     search_base: str,
     mute: bool,
-) -> list[dict[str, Any]]:
+) -> AsyncIterator[dict[str, Any]]:
     # TODO: Consider using upstream paged_search_generator instead of this?
     # TODO: Eliminate mute argument? - Should be logger configuration?
     # TODO: Find max. paged_size number from LDAP rather than hard-code it?
@@ -444,7 +464,6 @@ async def _paged_search(
 
     # Max 10_000 pages to avoid eternal loops
     # TODO: Why would we get eternal loops?
-    responses: list[dict[str, Any]] = []
     for page in range(0, 10_000):
         if not mute:
             logger.info("Searching page", page=page)
@@ -452,7 +471,7 @@ async def _paged_search(
         try:
             response, result = await ldap_search(ldap_connection, **searchParameters)
         except LDAPNoSuchObjectResult:
-            return responses
+            return
 
         if result["description"] == "operationsError":
             # TODO: Should this be an exception?
@@ -462,26 +481,70 @@ async def _paged_search(
                 search_filter=search_filter,
                 result=result,
             )
-            break
+            return
 
         # TODO: Handle this error more gracefully
         assert response is not None
-        entries = ldapresponse2entries(response)
-        responses.extend(entries)
+        for entry in ldapresponse2entries(response):
+            yield entry
 
         try:
             # TODO: Skal "1.2.840.113556.1.4.319" være Configurerbar?
             extension = "1.2.840.113556.1.4.319"
             cookie = result["controls"][extension]["value"]["cookie"]
         except KeyError:
-            break
+            return
 
         if cookie and isinstance(cookie, bytes):
             searchParameters["paged_cookie"] = cookie
         else:
-            break
+            return
+
+
+async def paged_search_iter(
+    settings: Settings,
+    ldap_connection: Connection,
+    searchParameters: dict,
+    search_base: str | None = None,
+    mute: bool = False,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Execute a paged search on the LDAP server, yielding the entries one at a time.
+
+    Unlike `paged_search` the entries are not collected into a list, thus callers
+    can process each entry as its page arrives, instead of holding the entire result.
+
+    Args:
+        searchParameters:
+            Dict with the following keys:
+                * search_filter
+                * attributes
+        search_base:
+            Search base to search in.
+            If empty, uses settings.search_base combined with settings.ous_to_search_in.
+        mute: Whether to log process information
+
+    Yields:
+        Search results.
+    """
+    if search_base:
+        # If the search base is explicitly defined: Don't try anything fancy.
+        async for entry in _paged_search_iter(
+            ldap_connection, searchParameters, search_base, mute
+        ):
+            yield entry
+        return
 
-    return responses
+    # Otherwise, loop over all OUs to search in
+    search_bases = [
+        combine_dn_strings([ou, settings.ldap_search_base])
+        for ou in settings.ldap_ous_to_search_in
+    ]
+    for search_base in search_bases:
+        async for entry in _paged_search_iter(
+            ldap_connection, searchParameters.copy(), search_base, mute
+        ):
+            yield entry
 
 
 async def paged_search(
@@ -512,28 +575,12 @@ async def paged_search(
     #       Except from a single call from usernames.py
     # TODO: Consider moving this to its own module separate from business logic
     # TODO: Make a class for the searchParameters if it has a fixed format?
-
-    if search_base:
-        # If the search base is explicitly defined: Don't try anything fancy.
-        results = await _paged_search(
-            ldap_connection, searchParameters, search_base, mute
+    return [
+        entry
+        async for entry in paged_search_iter(
+            settings, ldap_connection, searchParameters, search_base, mute
         )
-        return results
-
-    # Otherwise, loop over all OUs to search in
-    search_bases = [
-        combine_dn_strings([ou, settings.ldap_search_base])
-        for ou in settings.ldap_ous_to_search_in
     ]
-    results = []
-    for search_base in search_bases:
-        results.extend(
-            await _paged_search(
-                ldap_connection, searchParameters.copy(), search_base, mute
-            )
-        )
-
-    return results
 
 
 async def object_search(
@@ -558,16 +605,21 @@ async def object_search(
     Returns:
         A list of found objects.
     """
-    search_bases = ensure_list(searchParameters["search_base"])
-
-    responses = []
-    # TODO: Asyncio.gather this? - or combine the filters?
-    for search_base in search_bases:
-        response, _ = await ldap_search(
-            ldap_connection, **ChainMap(searchParameters, {"search_base": search_base})
+    # Deduplicate while preserving order, a search base listed twice would
+    # otherwise be searched twice and yield every entry twice
+    search_bases = list(dict.fromkeys(ensure_list(searchParameters["search_base"])))
+
+    # The searches are independent, so run them concurrently
+    results = await asyncio.gather(
+        *(
+            ldap_search(
+                ldap_connection,
+                **ChainMap(searchParameters, {"search_base": search_base}),
+            )
+            for search_base in search_bases
         )
-        if response:
-            responses.extend(response)
+    )
+    responses = [entry for response, _ in results if response for entry in response]
     search_entries = ldapresponse2entries(responses)
     return search_entries
 
@@ -35,8 +35,7 @@ from sqlalchemy.orm import mapped_column
 from . import depends
 from .config import Settings
 from .database import Base
-from .ldap import _paged_search
-from .ldap import ldapresponse2entries
+from .ldap import _paged_search_iter
 from .ldap_emit import publish_uuids
 from .utils import combine_dn_strings
 
@@ -160,16 +159,6 @@ async def _poll(
     #       controllers we may get duplicate (fine) and missed (not fine) events.
     search_filter = f"(modifyTimestamp>={datetime_to_ldap_timestamp(last_search_time)})"
 
-    response = await _paged_search(
-        ldap_connection,
-        {"search_filter": search_filter, "attributes": [ldap_unique_id_field]},
-        search_base,
-        mute=False,
-    )
-
-    # Filter to only keep search results
-    responses = ldapresponse2entries(response)
-
     def event2uuid(event: dict[str, Any]) -> UUID | None:
         uuid = event.get("attributes", {}).get(ldap_unique_id_field, None)
         if uuid is None:
@@ -177,7 +166,16 @@ async def _poll(
             return None
         return UUID(uuid)
 
-    uuids_with_none = {event2uuid(event) for event in responses}
+    # Entries are consumed page by page, rather than collecting the full result
+    uuids_with_none = {
+        event2uuid(event)
+        async for event in _paged_search_iter(
+            ldap_connection,
+            {"search_filter": search_filter, "attributes": [ldap_unique_id_field]},
+            search_base,
+            mute=False,
+        )
+    }
     uuids_with_none.discard(None)
     uuids = cast(set[UUID], uuids_with_none)
     return uuids
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Magenta ApS <https://magenta.dk>
 # SPDX-License-Identifier: MPL-2.0
 import asyncio
+from functools import lru_cache
 from typing import Any
 from typing import cast
 from uuid import UUID
@@ -25,10 +26,8 @@ from .ldap import get_ldap_object
 from .ldap import ldap_add
 from .ldap import ldap_modify
 from .ldap import ldap_modify_dn
-from .ldap import make_ldap_object
 from .ldap import object_search
 from .ldap import single_object_search
-from .ldap_classes import LdapObject
 from .types import DN
 from .types import CPRNumber
 from .utils import combine_dn_strings
@@ -38,6 +37,13 @@ from .utils import is_exception
 logger = structlog.stdlib.get_logger()
 
 
+# Only a handful of distinct OU configurations are ever seen, as they come from settings
+@lru_cache(maxsize=16)
+def normalize_ous(ous: tuple[str, ...]) -> tuple[str, ...]:
+    """Normalize the given OUs using safe_dn, memoized as settings rarely change."""
+    return tuple(safe_dn(ou) for ou in ous)
+
+
 class LDAPAPI:
     def __init__(self, settings: Settings, ldap_connection: Connection) -> None:
         self.settings = settings
@@ -53,7 +59,7 @@ class LDAPAPI:
             return True
 
         ou = extract_ou_from_dn(dn)
-        ous_to_write_to = [safe_dn(ou) for ou in self.settings.ldap_ous_to_write_to]
+        ous_to_write_to = normalize_ous(tuple(self.settings.ldap_ous_to_write_to))
         for ou_to_write_to in ous_to_write_to:
             if ou.endswith(ou_to_write_to):
                 # If an OU ends with one of the OUs-to-write-to, it's OK.
@@ -232,13 +238,10 @@ class LDAPAPI:
             search_results = await object_search(searchParameters, self.ldap_connection)
         except LDAPNoSuchObjectResult:
             return set()
-        ldap_objects: list[LdapObject] = [
-            await make_ldap_object(search_result, self.ldap_connection)
-            for search_result in search_results
-        ]
-        dns = {obj.dn for obj in ldap_objects}
+        # No attributes are requested, so the DNs can be read off the results
+        dns = {search_result["dn"] for search_result in search_results}
         logger.info("Found LDAP(s) object", dns=dns)
-        return set(dns)
+        return dns
 
     async def modify_ldap_object(
         self,
@@ -298,12 +301,15 @@ class LDAPAPI:
             raise exc
 
         # MODIFY-DN
-        ldap_uuid = await self.get_ldap_unique_ldap_uuid(dn)
         requested_dn_changes = {
             attribute: values
             for attribute, values in requested_changes.items()
             if attribute.casefold() in modify_dn_attributes
         }
+        # Only look up the UUID when the DN is actually changed, saving a roundtrip
+        if not requested_dn_changes:
+            return None
+        ldap_uuid = await self.get_ldap_unique_ldap_uuid(dn)
         for attribute, values in requested_dn_changes.items():
             # The user's DN is changed by our modifications, but its UUID does not
             current_dn = await self.get_ldap_dn(ldap_uuid)
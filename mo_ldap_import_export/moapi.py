@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Magenta ApS <https://magenta.dk>
 # SPDX-License-Identifier: MPL-2.0
 import asyncio
+import time
 from collections.abc import Generator
 from collections.abc import Sequence
 from datetime import UTC
@@ -8,6 +9,7 @@ from datetime import datetime
 from enum import Enum
 from enum import auto
 from typing import Any
+from typing import Generic
 from typing import Protocol
 from typing import TypeVar
 from typing import cast
@@ -60,6 +62,33 @@ from .utils import star
 
 logger = structlog.stdlib.get_logger()
 
+# Reference data UUIDs are only trusted this long before they are refetched
+REFERENCE_DATA_CACHE_TTL_SECONDS = 300.0
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Dictionary-like cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if expiry <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
 
 class Verb(Enum):
     CREATE = auto()
@@ -94,10 +123,10 @@ def extract_current_or_latest_validity(validities: list[T]) -> T | None:
     if len(validities) <= 1:
         return only(validities)
 
-    def is_current(val: T) -> bool:
-        # Cannot use datetime.utcnow as it is not timezone aware
-        now_utc = datetime.now(UTC)
+    # Cannot use datetime.utcnow as it is not timezone aware
+    now_utc = datetime.now(UTC)
 
+    def is_current(val: T) -> bool:
         match (val.validity.from_, val.validity.to):
             case (None, None):
                 return True
@@ -151,6 +180,50 @@ def flatten_validities(
         yield from obj.validities
 
 
+def address_from_validity(validity: Any) -> Address:
+    """Construct an Address model from an address validity read from MO.
+
+    Args:
+        validity: An address validity with the fields of the read_addresses query.
+
+    Returns:
+        The corresponding Address model.
+    """
+    entry = jsonable_encoder(validity)
+    return Address(
+        uuid=entry["uuid"],
+        value=entry["value"],
+        value2=entry["value2"],
+        address_type=entry["address_type"]["uuid"],
+        person=entry["employee_uuid"],
+        org_unit=entry["org_unit_uuid"],
+        engagement=entry["engagement_uuid"],
+        visibility=entry["visibility_uuid"],
+        validity=entry["validity"],
+    )
+
+
+def ituser_from_validity(uuid: UUID, validity: Any) -> ITUser:
+    """Construct an ITUser model from an it-user validity read from MO.
+
+    Args:
+        uuid: The UUID of the it-user.
+        validity: An it-user validity with the fields of the read_itusers query.
+
+    Returns:
+        The corresponding ITUser model.
+    """
+    entry = jsonable_encoder(validity)
+    return ITUser(
+        uuid=uuid,
+        user_key=entry["user_key"],
+        itsystem=entry["itsystem_uuid"],
+        person=entry["employee_uuid"],
+        engagement=entry["engagement_uuid"],
+        validity=entry["validity"],
+    )
+
+
 async def get_primary_engagement(
     graphql_client: GraphQLClient, uuid: EmployeeUUID
 ) -> UUID | None:
@@ -239,11 +312,36 @@ async def get_primary_engagement(
     return primary_engagement_uuid
 
 
+async def read_class_uuid(
+    graphql_client: GraphQLClient, class_user_key: str, facet_user_key: str
+) -> str:
+    result = await graphql_client.read_class_uuid_by_facet_and_class_user_key(
+        facet_user_key, class_user_key
+    )
+    exception = UUIDNotFoundException(
+        f"class not found, facet_user_key: {facet_user_key} class_user_key: {class_user_key}"
+    )
+    return str(one(result.objects, too_short=exception).uuid)
+
+
 class MOAPI:
     def __init__(self, settings: Settings, graphql_client: GraphQLClient) -> None:
         self.settings = settings
         self.graphql_client = graphql_client
         self.create_mo_class_lock = asyncio.Lock()
+        # IT-systems, facets and classes are reference data which is rarely changed,
+        # thus their UUIDs are cached. Entries expire after
+        # REFERENCE_DATA_CACHE_TTL_SECONDS, so changes in MO are eventually seen.
+        # Only found UUIDs are cached, as missing objects may be created later.
+        self.it_system_uuid_cache: TTLCache[str, str] = TTLCache(
+            REFERENCE_DATA_CACHE_TTL_SECONDS
+        )
+        self.facet_uuid_cache: TTLCache[str, UUID] = TTLCache(
+            REFERENCE_DATA_CACHE_TTL_SECONDS
+        )
+        self.class_uuid_cache: TTLCache[tuple[str, str], str] = TTLCache(
+            REFERENCE_DATA_CACHE_TTL_SECONDS
+        )
 
     async def find_mo_employee_uuid_via_ituser(
         self, unique_uuid: UUID
@@ -258,11 +356,30 @@ class MOAPI:
         }
 
     async def get_it_system_uuid(self, itsystem_user_key: str) -> str:
+        cached = self.it_system_uuid_cache.get(itsystem_user_key)
+        if cached is not None:
+            return cached
+
         result = await self.graphql_client.read_itsystem_uuid(itsystem_user_key)
         exception = UUIDNotFoundException(
             f"itsystem not found, user_key: {itsystem_user_key}"
         )
-        return str(one(result.objects, too_short=exception).uuid)
+        uuid = str(one(result.objects, too_short=exception).uuid)
+        self.it_system_uuid_cache.set(itsystem_user_key, uuid)
+        return uuid
+
+    async def get_class_uuid(self, class_user_key: str, facet_user_key: str) -> str:
+        # Templates look up the same few classes for every object they render
+        key = (class_user_key, facet_user_key)
+        cached = self.class_uuid_cache.get(key)
+        if cached is not None:
+            return cached
+
+        uuid = await read_class_uuid(
+            self.graphql_client, class_user_key, facet_user_key
+        )
+        self.class_uuid_cache.set(key, uuid)
+        return uuid
 
     async def load_mo_employee(
         self, uuid: UUID, current_objects_only=True
@@ -331,6 +448,10 @@ class MOAPI:
         Returns:
             The uuid of the facet or None if not found.
         """
+        cached = self.facet_uuid_cache.get(user_key)
+        if cached is not None:
+            return cached
+
         result = await self.graphql_client.read_facet_uuid(user_key)
         too_long = MultipleObjectsReturnedException(
             f"Found multiple facets with user_key = '{user_key}': {result}"
@@ -338,6 +459,7 @@ class MOAPI:
         facet = only(result.objects, too_long=too_long)
         if facet is None:
             return None
+        self.facet_uuid_cache.set(user_key, facet.uuid)
         return facet.uuid
 
     async def load_mo_it_user(
@@ -351,16 +473,7 @@ class MOAPI:
         result_entry = extract_current_or_latest_validity(result.validities)
         if result_entry is None:  # pragma: no cover
             return None
-        entry = jsonable_encoder(result_entry)
-        it_user = ITUser(
-            uuid=uuid,
-            user_key=entry["user_key"],
-            itsystem=entry["itsystem_uuid"],
-            person=entry["employee_uuid"],
-            engagement=entry["engagement_uuid"],
-            validity=entry["validity"],
-        )
-        return it_user
+        return ituser_from_validity(uuid, result_entry)
 
     async def load_mo_address(
         self, uuid: UUID, current_objects_only: bool = True
@@ -382,18 +495,7 @@ class MOAPI:
         result_entry = extract_current_or_latest_validity(result.validities)
         if result_entry is None:  # pragma: no cover
             return None
-        entry = jsonable_encoder(result_entry)
-        return Address(
-            uuid=entry["uuid"],
-            value=entry["value"],
-            value2=entry["value2"],
-            address_type=entry["address_type"]["uuid"],
-            person=entry["employee_uuid"],
-            org_unit=entry["org_unit_uuid"],
-            engagement=entry["engagement_uuid"],
-            visibility=entry["visibility_uuid"],
-            validity=entry["validity"],
-        )
+        return address_from_validity(result_entry)
 
     async def load_mo_engagement(
         self,
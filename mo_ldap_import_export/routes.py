@@ -5,6 +5,7 @@
 import asyncio
 import csv
 import re
+from collections import defaultdict
 from collections.abc import AsyncIterator
 from collections.abc import Awaitable
 from collections.abc import Callable
@@ -45,7 +46,7 @@ from .ldap import apply_discriminator
 from .ldap import get_ldap_object
 from .ldap import make_ldap_object
 from .ldap import object_search
-from .ldap import paged_search
+from .ldap import paged_search_iter
 from .ldap_classes import LdapObject
 from .ldap_emit import publish_uuids
 from .types import DN
@@ -57,6 +58,9 @@ from .utils import extract_ou_from_dn
 
 logger = structlog.stdlib.get_logger()
 
+# Upper bound on the per-class paged searches run by the populated overview
+MAX_CONCURRENT_CLASS_SEARCHES = 4
+
 
 def get_ldap_schema(ldap_connection: Connection):
     # On OpenLDAP this returns a ldap3.protocol.rfc4512.SchemaInfo
@@ -95,19 +99,41 @@ def get_ldap_superiors(ldap_connection: Connection, root_ldap_object: str) -> li
     return superiors
 
 
-def get_ldap_attributes(ldap_connection: Connection, root_ldap_object: str):
-    """
-    ldap_connection : ldap connection object
-    ldap_object : ldap class to fetch attributes for. for example "organizationalPerson"
+def get_ldap_class_info(ldap_connection: Connection) -> dict[str, tuple[list, list]]:
+    """Walk the LDAP schema once, collecting attributes and superiors for all classes.
+
+    The attributes of a class are the attributes it may contain, followed by those
+    of its superiors. Each class' superiors are only resolved once, instead of once
+    per subclass.
+
+    Args:
+        ldap_connection: The LDAP connection to read the schema from.
+
+    Returns:
+        Mapping from object class name to an (attributes, superiors) tuple.
     """
+    schema = get_ldap_schema(ldap_connection)
+    object_classes = schema.object_classes
+
+    superiors_cache: dict[str, list] = {}
 
-    all_attributes = []
-    superiors = get_ldap_superiors(ldap_connection, root_ldap_object)
+    def get_superiors(ldap_class: str) -> list:
+        if ldap_class not in superiors_cache:
+            superiors = []
+            for ldap_object in always_iterable(object_classes[ldap_class].superior):
+                superiors.append(ldap_object)
+                superiors.extend(get_superiors(ldap_object))
+            superiors_cache[ldap_class] = superiors
+        return superiors_cache[ldap_class]
 
-    for ldap_object in [root_ldap_object] + superiors:
-        object_schema = get_ldap_object_schema(ldap_connection, ldap_object)
-        all_attributes += object_schema.may_contain
-    return all_attributes
+    output = {}
+    for ldap_class in sorted(list(object_classes.keys())):
+        superiors = get_superiors(ldap_class)
+        attributes = []
+        for ldap_object in [ldap_class] + superiors:
+            attributes += object_classes[ldap_object].may_contain
+        output[ldap_class] = (attributes, superiors)
+    return output
 
 
 async def valid_cpr(cpr: str) -> CPRNumber:
@@ -147,13 +173,15 @@ async def load_ldap_attribute_values(
         "attributes": [attribute],
     }
 
-    responses = await paged_search(
-        settings,
-        ldap_connection,
-        searchParameters,
-        search_base=search_base,
-    )
-    return {str(r["attributes"][attribute]) for r in responses}
+    return {
+        str(r["attributes"][attribute])
+        async for r in paged_search_iter(
+            settings,
+            ldap_connection,
+            searchParameters,
+            search_base=search_base,
+        )
+    }
 
 
 async def load_ldap_objects(
@@ -181,15 +209,17 @@ async def load_ldap_objects(
         "attributes": list(set(attributes)),
     }
 
-    responses = await paged_search(
-        settings,
-        ldap_connection,
-        searchParameters,
-        search_base=search_base,
-    )
-
+    # Objects are constructed as each page arrives, rather than after the full search
     output: list[LdapObject]
-    output = [await make_ldap_object(r, ldap_connection, nest=False) for r in responses]
+    output = [
+        await make_ldap_object(r, ldap_connection, nest=False)
+        async for r in paged_search_iter(
+            settings,
+            ldap_connection,
+            searchParameters,
+            search_base=search_base,
+        )
+    ]
 
     return output
 
@@ -202,41 +232,51 @@ async def load_ldap_populated_overview(
     """
     Like load_ldap_overview but only returns fields which actually contain data
     """
-    nan_values: list[None | list] = [None, []]
-
-    output = {}
-    overview = load_ldap_overview(ldap_connection)
+    attribute_types = get_attribute_types(ldap_connection)
+    # Every in-flight paged search occupies an executor thread while waiting for
+    # its response, so only a few classes are searched at a time
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLASS_SEARCHES)
 
-    for ldap_class in ldap_classes:
+    async def load_class_overview(ldap_class: str) -> dict | None:
         searchParameters = {
             "search_filter": f"(objectclass={ldap_class})",
             "attributes": ["*"],
         }
 
-        responses = await paged_search(settings, ldap_connection, searchParameters)
-        responses = [
-            r
-            for r in responses
-            if r["attributes"]["objectClass"][-1].lower() == ldap_class.lower()
-        ]
-
-        populated_attributes = []
+        populated_attributes: set[str] = set()
         example_value_dict = {}
-        for response in responses:
-            for attribute, value in response["attributes"].items():
-                if value not in nan_values:
-                    populated_attributes.append(attribute)
-                    if attribute not in example_value_dict:
-                        example_value_dict[attribute] = value
-        populated_attributes = list(set(populated_attributes))
-
-        if len(populated_attributes) > 0:
-            superiors = overview[ldap_class]["superiors"]
-            output[ldap_class] = make_overview_entry(
-                ldap_connection, populated_attributes, superiors, example_value_dict
-            )
+        async with semaphore:
+            async for response in paged_search_iter(
+                settings, ldap_connection, searchParameters
+            ):
+                object_class = response["attributes"]["objectClass"][-1]
+                if object_class.lower() != ldap_class.lower():
+                    continue
+                for attribute, value in response["attributes"].items():
+                    if value is not None and value != []:
+                        populated_attributes.add(attribute)
+                        if attribute not in example_value_dict:
+                            example_value_dict[attribute] = value
 
-    return output
+        if not populated_attributes:
+            return None
+        superiors = get_ldap_superiors(ldap_connection, ldap_class)
+        return make_overview_entry(
+            attribute_types, populated_attributes, superiors, example_value_dict
+        )
+
+    # The connection uses the asynchronous strategy, thus the paged searches for
+    # several classes can be in flight at the same time, each tracked by message id
+    class_overviews = await asyncio.gather(
+        *(load_class_overview(ldap_class) for ldap_class in ldap_classes)
+    )
+    return {
+        ldap_class: class_overview
+        for ldap_class, class_overview in zip(
+            ldap_classes, class_overviews, strict=True
+        )
+        if class_overview is not None
+    }
 
 
 async def paged_query(
@@ -306,9 +346,8 @@ async def get_non_existing_unique_ldap_uuids(
 
 
 def make_overview_entry(
-    ldap_connection: Connection, attributes, superiors, example_value_dict=None
-):
-    attribute_types = get_attribute_types(ldap_connection)
+    attribute_types, attributes, superiors, example_value_dict=None
+) -> dict[str, Any]:
     attribute_dict = {}
     for attribute in attributes:
         # skip unmapped types
@@ -336,19 +375,13 @@ def make_overview_entry(
 
 
 def load_ldap_overview(ldap_connection: Connection):
-    schema = get_ldap_schema(ldap_connection)
-
-    all_object_classes = sorted(list(schema.object_classes.keys()))
-
-    output = {}
-    for ldap_class in all_object_classes:
-        all_attributes = get_ldap_attributes(ldap_connection, ldap_class)
-        superiors = get_ldap_superiors(ldap_connection, ldap_class)
-        output[ldap_class] = make_overview_entry(
-            ldap_connection, all_attributes, superiors
-        )
-
-    return output
+    # Fetched once, rather than once per object class
+    attribute_types = get_attribute_types(ldap_connection)
+    class_info = get_ldap_class_info(ldap_connection)
+    return {
+        ldap_class: make_overview_entry(attribute_types, all_attributes, superiors)
+        for ldap_class, (all_attributes, superiors) in class_info.items()
+    }
 
 
 async def load_ldap_OUs(
@@ -363,14 +396,16 @@ async def load_ldap_OUs(
         "attributes": [],
     }
 
-    responses = await paged_search(
-        settings,
-        ldap_connection,
-        searchParameters,
-        search_base=search_base,
-        mute=True,
-    )
-    dns = [r["dn"] for r in responses]
+    dns = [
+        r["dn"]
+        async for r in paged_search_iter(
+            settings,
+            ldap_connection,
+            searchParameters,
+            search_base=search_base,
+            mute=True,
+        )
+    ]
 
     user_object_class = settings.ldap_user_objectclass
     dn_responses = await asyncio.gather(
@@ -441,11 +476,12 @@ async def load_ldap_cpr_object(
     search_results = await object_search(
         searchParameters, dataloader.ldapapi.ldap_connection
     )
-    # TODO: Asyncio gather this
-    ldap_objects: list[LdapObject] = [
-        await make_ldap_object(search_result, dataloader.ldapapi.ldap_connection)
-        for search_result in search_results
-    ]
+    ldap_objects: list[LdapObject] = await asyncio.gather(
+        *(
+            make_ldap_object(search_result, dataloader.ldapapi.ldap_connection)
+            for search_result in search_results
+        )
+    )
     dns = [obj.dn for obj in ldap_objects]
     logger.info("Found LDAP(s) object", dns=dns)
     return ldap_objects
@@ -698,22 +734,15 @@ def construct_router(settings: Settings) -> APIRouter:
             "attributes": [cpr_field],
         }
 
-        responses = [
-            r
-            for r in await paged_search(settings, ldap_connection, searchParameters)
-            if r["attributes"][cpr_field]
-        ]
-
-        cpr_values = [r["attributes"][cpr_field] for r in responses]
-        output = {}
-
-        for cpr in set(cpr_values):
-            if cpr_values.count(cpr) > 1:
-                output[cpr] = [
-                    r["dn"] for r in responses if r["attributes"][cpr_field] == cpr
-                ]
+        # Group DNs by CPR number in a single pass, instead of counting and
+        # filtering the full result list once per distinct CPR number
+        dns_by_cpr: defaultdict[str, list[str]] = defaultdict(list)
+        async for r in paged_search_iter(settings, ldap_connection, searchParameters):
+            cpr = r["attributes"][cpr_field]
+            if cpr:
+                dns_by_cpr[cpr].append(r["dn"])
 
-        return output
+        return {cpr: dns for cpr, dns in dns_by_cpr.items() if len(dns) > 1}
 
     # Get all objects from LDAP with invalid cpr numbers
     @router.get("/Inspect/invalid_cpr_numbers", status_code=202, tags=["LDAP"])
@@ -820,7 +849,9 @@ def construct_router(settings: Settings) -> APIRouter:
             logger.info("Found no DNs for cpr_number")
             raise HTTPException(status_code=404, detail="No DNs found for CPR number")
 
-        best_dn = await apply_discriminator(settings, ldap_connection, dns)
+        best_dn = await apply_discriminator(
+            settings, ldap_connection, dns, dataloader.discriminator_templates
+        )
         if best_dn is None:
             logger.info("No DNs survived discriminator")
             raise HTTPException(status_code=404, detail="No DNs survived discriminator")
@@ -856,7 +887,9 @@ def construct_router(settings: Settings) -> APIRouter:
             logger.info("Found no DNs for cpr_number")
             raise HTTPException(status_code=404, detail="No DNs found for CPR number")
 
-        best_dn = await apply_discriminator(settings, ldap_connection, dns)
+        best_dn = await apply_discriminator(
+            settings, ldap_connection, dns, dataloader.discriminator_templates
+        )
         if best_dn is None:
             logger.info("No DNs survived discriminator")
             raise HTTPException(status_code=404, detail="No DNs survived discriminator")
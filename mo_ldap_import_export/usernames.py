@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Magenta ApS <https://magenta.dk>
 # SPDX-License-Identifier: MPL-2.0
 import re
+from collections.abc import Collection
 from collections.abc import Iterator
 from typing import Any
 from uuid import UUID
@@ -42,7 +43,8 @@ class UserNameGenerator:
         self.char_replacement = (
             settings.conversion_mapping.username_generator.char_replacement
         )
-        self.forbidden_usernames = (
+        # Hashed once, as it is checked for every username permutation we try
+        self.forbidden_usernames: Collection[str] = frozenset(
             settings.conversion_mapping.username_generator.forbidden_usernames
         )
         self.combinations = (
@@ -63,17 +65,16 @@ class UserNameGenerator:
             search_base,
         )
 
-        output = {}
-        for attribute in attributes:
-            values = set()
-            for entry in search_result:
+        # Collect the values for all attributes in a single pass over the result
+        output: dict[str, set[Any]] = {attribute: set() for attribute in attributes}
+        for entry in search_result:
+            for attribute, values in output.items():
                 value = entry["attributes"][attribute]
                 if not value:
                     continue
                 if isinstance(value, list):
                     value = one(value)
                 values.add(value.lower())
-            output[attribute] = values
         return output
 
     def _make_cn(self, username_string: str):
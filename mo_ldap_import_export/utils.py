@@ -4,6 +4,7 @@ import copy
 import re
 from datetime import datetime
 from datetime import time
+from functools import lru_cache
 from functools import partial
 from functools import wraps
 from typing import Any
@@ -50,22 +51,25 @@ def import_class(name: str) -> type[MOBase]:
     return clazz
 
 
-# https://stackoverflow.com/questions/3405715/elegant-way-to-remove-fields-from-nested-dictionaries
-def _delete_keys_from_dict(dict_del, lst_keys):
-    for field in list(dict_del.keys()):
-        if field in lst_keys:
-            del dict_del[field]
-        elif isinstance(dict_del[field], dict):
-            _delete_keys_from_dict(dict_del[field], lst_keys)
-    return dict_del
-
-
 def delete_keys_from_dict(dict_del, lst_keys):
     """
     Delete the keys present in lst_keys from the dictionary.
     Loops recursively over nested dictionaries.
+
+    The input is left untouched, a filtered copy is built in a single pass.
     """
-    return _delete_keys_from_dict(copy.deepcopy(dict_del), lst_keys)
+    keys_to_delete = set(lst_keys)
+
+    def filter_dict(dictionary: dict) -> dict:
+        return {
+            key: (
+                filter_dict(value) if isinstance(value, dict) else copy.deepcopy(value)
+            )
+            for key, value in dictionary.items()
+            if key not in keys_to_delete
+        }
+
+    return filter_dict(dict_del)
 
 
 # TODO: this doesn't work in any possible definition of the word "work". Delete
@@ -101,6 +105,8 @@ def remove_vowels(string: str) -> str:
     return re.sub("[aeiouAEIOU]", "", string)
 
 
+# DNs under the same OU are extracted over and over during a sync
+@lru_cache(maxsize=4096)
 def extract_part_from_dn(dn: str, index_string: str) -> str:
     """
     Extract a part from an LDAP DN string
@@ -110,12 +116,12 @@ def extract_part_from_dn(dn: str, index_string: str) -> str:
     >>> extract_part_from_dn("CN=Tobias,OU=mucki,OU=bar,DC=k","OU")
     >>> "OU=mucki,OU=bar"
     """
-    dn_parts = to_dn(dn)
-    parts = []
-    for dn_part in dn_parts:
-        dn_decomposed = parse_dn(dn_part)[0]
-        if dn_decomposed[0].lower() == index_string.lower():
-            parts.append(dn_part)
+    index_string = index_string.lower()
+    parts = [
+        dn_part
+        for dn_part in to_dn(dn)
+        if parse_dn(dn_part)[0][0].lower() == index_string
+    ]
 
     if not parts:
         return ""
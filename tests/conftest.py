@@ -28,7 +28,7 @@ from pytest import Item
 
 from mo_ldap_import_export.autogenerated_graphql_client import GraphQLClient
 from mo_ldap_import_export.config import Settings
-from mo_ldap_import_export.ldap import _paged_search
+from mo_ldap_import_export.ldap import _paged_search_iter
 from mo_ldap_import_export.ldap import ldap_delete
 from mo_ldap_import_export.ldap_classes import LdapObject
 from mo_ldap_import_export.ldapapi import LDAPAPI
@@ -456,13 +456,15 @@ async def purge_ldap(ldap_connection: Connection) -> AsyncIterator[None]:
             "search_filter": "(objectclass=*)",
             "attributes": NO_ATTRIBUTES,
         }
-        response = await _paged_search(
-            ldap_connection,
-            searchParameters,
-            settings.ldap_search_base,
-            mute=False,
-        )
-        dns = set(map(entry2dn, response))
+        dns = {
+            entry2dn(entry)
+            async for entry in _paged_search_iter(
+                ldap_connection,
+                searchParameters,
+                settings.ldap_search_base,
+                mute=False,
+            )
+        }
         dns.discard(settings.ldap_search_base)  # root attribute is kept
         return dns
 
@@ -31,11 +31,10 @@ from mo_ldap_import_export.config import ConversionMapping
 from mo_ldap_import_export.config import Settings
 from mo_ldap_import_export.converters import LdapConverter
 from mo_ldap_import_export.environments import _create_facet_class
-from mo_ldap_import_export.environments import get_employee_address_type_uuid
+from mo_ldap_import_export.environments import construct_globals_dict
 from mo_ldap_import_export.environments import get_job_function_name
 from mo_ldap_import_export.environments import get_or_create_job_function_uuid
 from mo_ldap_import_export.environments import get_org_unit_name
-from mo_ldap_import_export.environments import get_visibility_uuid
 from mo_ldap_import_export.exceptions import IncorrectMapping
 from mo_ldap_import_export.exceptions import NoObjectsReturnedException
 from mo_ldap_import_export.exceptions import UUIDNotFoundException
@@ -249,6 +248,17 @@ async def test_ldap_to_mo(converter: LdapConverter) -> None:
     assert not result
 
 
+def test_string2template_cache_is_per_environment(converter: LdapConverter) -> None:
+    environment = Environment()
+    template = converter.string2template(environment, "{{ x }}")
+    assert converter.string2template(environment, "{{ x }}") is template
+
+    other_environment = Environment()
+    other_template = converter.string2template(other_environment, "{{ x }}")
+    assert other_template is not template
+    assert other_template.environment is other_environment
+
+
 async def test_ldap_to_mo_dict_error(converter: LdapConverter) -> None:
     converter.mapping = converter._populate_mapping_with_templates(
         {
@@ -474,26 +484,35 @@ EMPLOYEE_OBJ = {
 
 @pytest.mark.parametrize("class_name", ["foo", "bar"])
 async def test_get_employee_address_type_uuid(
-    graphql_client: AsyncMock, class_name: str
+    context: Context, graphql_client: AsyncMock, class_name: str
 ) -> None:
+    settings = context["user_context"]["settings"]
+    dataloader = context["user_context"]["dataloader"]
+    dataloader.moapi = MOAPI(settings, graphql_client)
     class_uuid = str(uuid4())
 
     graphql_client.read_class_uuid_by_facet_and_class_user_key.map[
         ("employee_address_type", class_name)
     ] = class_uuid
-    assert (
-        await get_employee_address_type_uuid(graphql_client, class_name) == class_uuid
-    )
+    globals_dict = construct_globals_dict(settings, dataloader)
+    get_employee_address_type_uuid = globals_dict["get_employee_address_type_uuid"]
+    assert await get_employee_address_type_uuid(class_name) == class_uuid
 
 
 @pytest.mark.parametrize("class_name", ["Hemmelig", "Offentlig"])
-async def test_get_visibility_uuid(graphql_client: AsyncMock, class_name: str) -> None:
+async def test_get_visibility_uuid(
+    context: Context, graphql_client: AsyncMock, class_name: str
+) -> None:
+    settings = context["user_context"]["settings"]
+    dataloader = context["user_context"]["dataloader"]
+    dataloader.moapi = MOAPI(settings, graphql_client)
     class_uuid = str(uuid4())
 
     graphql_client.read_class_uuid_by_facet_and_class_user_key.map[
         ("visibility", class_name)
     ] = class_uuid
-    assert await get_visibility_uuid(graphql_client, class_name) == class_uuid
+    globals_dict = construct_globals_dict(settings, dataloader)
+    assert await globals_dict["get_visibility_uuid"](class_name) == class_uuid
 
 
 async def test_get_job_function_uuid(
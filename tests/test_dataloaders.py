@@ -7,6 +7,7 @@ import asyncio
 import datetime
 import json
 import time
+from collections.abc import AsyncIterator
 from collections.abc import Collection
 from collections.abc import Iterator
 from typing import Any
@@ -47,7 +48,6 @@ from mo_ldap_import_export.autogenerated_graphql_client.read_facet_uuid import (
     ReadFacetUuidFacets,
 )
 from mo_ldap_import_export.config import Settings
-from mo_ldap_import_export.dataloaders import DN
 from mo_ldap_import_export.dataloaders import DataLoader
 from mo_ldap_import_export.depends import LdapConverter
 from mo_ldap_import_export.environments import get_or_create_job_function_uuid
@@ -55,9 +55,12 @@ from mo_ldap_import_export.exceptions import DNNotFound
 from mo_ldap_import_export.exceptions import MultipleObjectsReturnedException
 from mo_ldap_import_export.exceptions import NoObjectsReturnedException
 from mo_ldap_import_export.exceptions import ReadOnlyException
+from mo_ldap_import_export.exceptions import UUIDNotFoundException
 from mo_ldap_import_export.ldap_classes import LdapObject
 from mo_ldap_import_export.ldapapi import LDAPAPI
 from mo_ldap_import_export.moapi import MOAPI
+from mo_ldap_import_export.moapi import REFERENCE_DATA_CACHE_TTL_SECONDS
+from mo_ldap_import_export.moapi import TTLCache
 from mo_ldap_import_export.moapi import Verb
 from mo_ldap_import_export.moapi import extract_current_or_latest_validity
 from mo_ldap_import_export.models import Address
@@ -68,6 +71,7 @@ from mo_ldap_import_export.routes import load_all_current_it_users
 from mo_ldap_import_export.routes import load_ldap_attribute_values
 from mo_ldap_import_export.routes import load_ldap_cpr_object
 from mo_ldap_import_export.routes import load_ldap_objects
+from mo_ldap_import_export.types import DN
 from mo_ldap_import_export.types import CPRNumber
 from tests.graphql_mocker import GraphQLMocker
 
@@ -566,13 +570,40 @@ async def test_get_ldap_it_system_uuid(
     route = graphql_mock.query("read_itsystem_uuid")
     route.result = {"itsystems": {"objects": [{"uuid": uuid}]}}
 
-    assert await dataloader.moapi.get_ldap_it_system_uuid() == str(uuid)
-    assert route.called
+    with freeze_time("2022-08-10") as frozen_time:
+        assert await dataloader.moapi.get_ldap_it_system_uuid() == str(uuid)
+        assert route.called
 
-    route.reset()
-    route.result = {"itsystems": {"objects": []}}
-    assert await dataloader.moapi.get_ldap_it_system_uuid() is None
-    assert route.called
+        # The UUID is cached after the first lookup
+        route.reset()
+        assert await dataloader.moapi.get_ldap_it_system_uuid() == str(uuid)
+        assert not route.called
+
+        # The cached UUID expires after the TTL
+        frozen_time.tick(REFERENCE_DATA_CACHE_TTL_SECONDS)
+        route.result = {"itsystems": {"objects": []}}
+        assert await dataloader.moapi.get_ldap_it_system_uuid() is None
+        assert route.called
+
+        # Missing IT-systems are not cached
+        route.reset()
+        assert await dataloader.moapi.get_ldap_it_system_uuid() is None
+        assert route.called
+
+
+def test_ttl_cache() -> None:
+    with freeze_time("2022-08-10") as frozen_time:
+        cache: TTLCache[str, int] = TTLCache(10)
+        assert cache.get("a") is None
+
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        frozen_time.tick(9)
+        assert cache.get("a") == 1
+
+        frozen_time.tick(1)
+        assert cache.get("a") is None
 
 
 async def test_find_mo_employee_dn(dataloader: MagicMock) -> None:
@@ -867,15 +898,17 @@ async def test_get_ldap_unique_ldap_uuid_no_objectguid(dataloader: DataLoader) -
 
 
 async def test_load_ldap_attribute_values(dataloader: DataLoader):
-    responses = [
+    responses: list[dict[str, Any]] = [
         {"attributes": {"foo": 1}},
         {"attributes": {"foo": "2"}},
         {"attributes": {"foo": []}},
     ]
-    with patch(
-        "mo_ldap_import_export.routes.paged_search",
-        return_value=responses,
-    ):
+
+    async def paged_search_iter(*args: Any, **kwargs: Any) -> AsyncIterator[dict]:
+        for response in responses:
+            yield response
+
+    with patch("mo_ldap_import_export.routes.paged_search_iter", paged_search_iter):
         settings = dataloader.settings
         ldap_connection = dataloader.ldapapi.ldap_connection
         values = await load_ldap_attribute_values(settings, ldap_connection, "foo")
@@ -952,8 +985,46 @@ async def test_load_mo_facet_uuid(dataloader: DataLoader, graphql_mock: GraphQLM
 
     route = graphql_mock.query("read_facet_uuid")
     route.result = {"facets": {"objects": [{"uuid": uuid}]}}
-    assert await dataloader.moapi.load_mo_facet_uuid("") == uuid
-    assert route.called
+    with freeze_time("2022-08-10") as frozen_time:
+        assert await dataloader.moapi.load_mo_facet_uuid("") == uuid
+        assert route.called
+
+        # The UUID is cached after the first lookup
+        route.reset()
+        assert await dataloader.moapi.load_mo_facet_uuid("") == uuid
+        assert not route.called
+
+        # The cached UUID expires after the TTL
+        frozen_time.tick(REFERENCE_DATA_CACHE_TTL_SECONDS)
+        assert await dataloader.moapi.load_mo_facet_uuid("") == uuid
+        assert route.called
+
+
+async def test_get_class_uuid(dataloader: DataLoader, graphql_mock: GraphQLMocker):
+    uuid = uuid4()
+
+    route = graphql_mock.query("read_class_uuid_by_facet_and_class_user_key")
+    route.result = {"classes": {"objects": []}}
+    with freeze_time("2022-08-10") as frozen_time:
+        with pytest.raises(UUIDNotFoundException):
+            await dataloader.moapi.get_class_uuid("Hemmelig", "visibility")
+
+        # Missing classes are not cached, as they may be created later
+        route.result = {"classes": {"objects": [{"uuid": uuid}]}}
+        result = await dataloader.moapi.get_class_uuid("Hemmelig", "visibility")
+        assert result == str(uuid)
+        assert route.call_count == 2
+
+        # The UUID is cached after the first successful lookup
+        result = await dataloader.moapi.get_class_uuid("Hemmelig", "visibility")
+        assert result == str(uuid)
+        assert route.call_count == 2
+
+        # The cached UUID expires after the TTL
+        frozen_time.tick(REFERENCE_DATA_CACHE_TTL_SECONDS)
+        result = await dataloader.moapi.get_class_uuid("Hemmelig", "visibility")
+        assert result == str(uuid)
+        assert route.call_count == 3
 
 
 async def test_load_mo_facet_uuid_multiple_facets(
@@ -981,6 +1052,23 @@ async def test_load_mo_facet_uuid_no_result(dataloader: DataLoader):
     assert result is None
 
 
+async def test_modify_ldap_object_without_dn_changes(
+    settings: Settings, ldap_connection: MagicMock
+) -> None:
+    ldapapi = LDAPAPI(settings, ldap_connection)
+    ldapapi.ou_in_ous_to_write_to = MagicMock(return_value=True)  # type: ignore
+
+    ldap_connection.get_response.return_value = [], {"type": "test"}
+
+    await ldapapi.modify_ldap_object(
+        DN("CN=foo,DC=bar"), {"title": ["Developer"], "mail": []}
+    )
+    ldap_connection.modify.assert_called_once()  # type: ignore
+    # No DN changes, thus no need to look up the object to rename it
+    ldap_connection.search.assert_not_called()  # type: ignore
+    ldap_connection.modify_dn.assert_not_called()  # type: ignore
+
+
 async def test_add_ldap_object(settings: Settings, ldap_connection: MagicMock) -> None:
     ldapapi = LDAPAPI(settings, ldap_connection)
 
@@ -15,6 +15,8 @@ def test_strip_non_digits() -> None:
     assert filter_strip_non_digits("01/01/01-1234") == "0101011234"
     assert filter_strip_non_digits("010101-1234") == "0101011234"
     assert filter_strip_non_digits(101011234) is None
+    # Non-ASCII digits are stripped as well
+    assert filter_strip_non_digits("٠١٢-3") == "3"
 
 
 def test_filter_mo_datestring():
@@ -9,6 +9,7 @@ from mo_ldap_import_export.autogenerated_graphql_client.client import GraphQLCli
 from mo_ldap_import_export.autogenerated_graphql_client.input_types import (
     OrganisationUnitCreateInput,
 )
+from mo_ldap_import_export.environments import get_org_unit_ancestor_names
 from mo_ldap_import_export.environments import get_org_unit_path_string
 from tests.graphql_mocker import GraphQLMocker
 
@@ -96,3 +97,8 @@ async def test_get_org_unit_path_string(graphql_mock: GraphQLMocker) -> None:
     assert (
         path == "Kolding Kommune\\Sundhed\\Plejecentre\\Plejecenter Nord\\Teknik Nord"
     )
+    assert route.call_count == 1
+
+    names = await get_org_unit_ancestor_names(graphql_client, str(uuid4()))
+    assert names == [*reversed(ancestors), "Teknik Nord"]
+    assert route.call_count == 2
@@ -765,6 +765,15 @@ async def test_render_ldap2mo(
     sync_tool.converter.environment = construct_environment(
         sync_tool.settings, sync_tool.dataloader
     )
+    # The template is compiled on construction, thus rebuild with the new template
+    sync_tool = SyncTool(
+        dataloader=sync_tool.dataloader,
+        converter=sync_tool.converter,
+        export_checks=sync_tool.export_checks,
+        import_checks=sync_tool.import_checks,
+        settings=sync_tool.settings,
+        ldap_connection=sync_tool.ldap_connection,
+    )
     uuid = EmployeeUUID(UUID("fa15edad-da1e-c0de-babe-c1a551f1ab1e"))
     if isinstance(expected, str):
         with pytest.raises(Exception) as exc_info:
@@ -776,7 +785,7 @@ async def test_render_ldap2mo(
 
 
 async def test_noop_listen_to_changes(sync_tool: SyncTool) -> None:
-    sync_tool.settings.conversion_mapping.mo2ldap = None  # type: ignore
+    sync_tool.mo2ldap_template = None
 
     with capture_logs() as cap_logs:
         result = await sync_tool.listen_to_changes_in_employees(uuid4())
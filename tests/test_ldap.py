@@ -38,13 +38,15 @@ from mo_ldap_import_export.ldap import is_uuid
 from mo_ldap_import_export.ldap import ldap_healthcheck
 from mo_ldap_import_export.ldap import make_ldap_object
 from mo_ldap_import_export.ldap import paged_search
+from mo_ldap_import_export.ldap import paged_search_iter
 from mo_ldap_import_export.ldap import single_object_search
 from mo_ldap_import_export.ldap_classes import LdapObject
 from mo_ldap_import_export.ldap_event_generator import LDAPEventGenerator
 from mo_ldap_import_export.ldap_event_generator import _poll
 from mo_ldap_import_export.ldap_event_generator import setup_poller
 from mo_ldap_import_export.routes import get_attribute_types
-from mo_ldap_import_export.routes import get_ldap_attributes
+from mo_ldap_import_export.routes import get_ldap_class_info
+from mo_ldap_import_export.routes import get_ldap_superiors
 
 from .test_dataloaders import mock_ldap_response
 
@@ -387,7 +389,7 @@ async def test_make_nested_ldap_object(cpr_field: str, context: Context):
     assert isinstance(ldap_object.band_members[1], LdapObject)  # type: ignore
 
 
-async def test_get_ldap_attributes():
+async def test_get_ldap_class_info_attributes():
     ldap_connection = MagicMock()
 
     # Simulate 3 levels
@@ -409,8 +411,41 @@ async def test_get_ldap_attributes():
     ldap_connection.server.schema.object_classes = object_classes
 
     # test the function
-    output = get_ldap_attributes(ldap_connection, str(levels[0]))
-    assert output == expected_output
+    attributes, superiors = get_ldap_class_info(ldap_connection)[str(levels[0])]
+    assert attributes == expected_output
+    assert superiors == ["middle", "top"]
+
+
+def test_get_ldap_class_info() -> None:
+    ldap_connection = MagicMock()
+
+    def make_schema(may_contain: list[str], superior: list[str] | None) -> MagicMock:
+        schema = MagicMock()
+        schema.may_contain = may_contain
+        schema.superior = superior
+        return schema
+
+    # A diamond shaped hierarchy, so "top" is reachable through two paths
+    ldap_connection.server.schema.object_classes = {
+        "top": make_schema(["objectClass"], None),
+        "person": make_schema(["cn", "sn"], ["top"]),
+        "mailRecipient": make_schema(["mail"], ["top"]),
+        "user": make_schema(["uid"], ["person", "mailRecipient"]),
+    }
+
+    output = get_ldap_class_info(ldap_connection)
+    assert output == {
+        "mailRecipient": (["mail", "objectClass"], ["top"]),
+        "person": (["cn", "sn", "objectClass"], ["top"]),
+        "top": (["objectClass"], []),
+        "user": (
+            ["uid", "cn", "sn", "objectClass", "mail", "objectClass"],
+            ["person", "top", "mailRecipient", "top"],
+        ),
+    }
+    # The superiors agree with the per-class lookup
+    for ldap_class, (_, superiors) in output.items():
+        assert superiors == get_ldap_superiors(ldap_connection, ldap_class)
 
 
 async def test_paged_search(
@@ -450,6 +485,46 @@ async def test_paged_search(
     assert output == expected_results * len(cookies)
 
 
+async def test_paged_search_iter(
+    context: Context, ldap_attributes: dict, ldap_connection: MagicMock
+):
+    dn = "CN=Nick Janssen,OU=Users,OU=Magenta,DC=ad,DC=addev"
+
+    expected_results = [mock_ldap_response(ldap_attributes, dn)]
+
+    # Simulate two pages
+    cookies = [bytes("first page", "utf-8"), None]
+    results = iter(
+        [
+            {
+                "controls": {"1.2.840.113556.1.4.319": {"value": {"cookie": cookie}}},
+                "description": "OK",
+            }
+            for cookie in cookies
+        ]
+    )
+
+    def set_new_result(*args, **kwargs) -> None:
+        ldap_connection.get_response.return_value = expected_results, next(results)
+
+    ldap_connection.search.side_effect = set_new_result
+
+    searchParameters = {
+        "search_filter": "(objectclass=organizationalPerson)",
+        "attributes": ["foo", "bar"],
+    }
+    settings = context["user_context"]["settings"]
+    iterator = paged_search_iter(
+        settings, ldap_connection, searchParameters, search_base="foo"
+    )
+    # Only the first page has been fetched when the first entry is yielded
+    assert await anext(iterator) == expected_results[0]
+    assert ldap_connection.search.call_count == 1
+
+    assert [entry async for entry in iterator] == expected_results
+    assert ldap_connection.search.call_count == 2
+
+
 async def test_paged_search_no_results(
     context: Context, ldap_attributes: dict, ldap_connection: MagicMock
 ):
@@ -548,6 +623,22 @@ async def test_single_object_search(ldap_connection: MagicMock, context: Context
     assert output == search_entry
 
 
+async def test_single_object_search_duplicate_search_bases(
+    ldap_connection: MagicMock,
+) -> None:
+    dn = "CN=foo,DC=bar"
+    search_entry = {"type": "searchResEntry", "dn": dn}
+    ldap_connection.get_response.return_value = [search_entry], {"type": "test"}
+
+    search_parameters = {
+        "search_base": ["OU=users,DC=bar", "OU=users,DC=bar"],
+        "search_filter": "CPR=010101-1234",
+    }
+    output = await single_object_search(search_parameters, ldap_connection)
+    assert output == search_entry
+    ldap_connection.search.assert_called_once()
+
+
 async def test_setup_poller() -> None:
     async def _poller(*args: Any) -> None:
         raise ValueError("BOOM")